@@ -12,6 +12,11 @@ PORT = int(os.getenv('PORT', 8080))
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
 
+# Scheduled high-impact releases (UTC), copied from the official calendars.
+# 'event' must be a NewsGuard.HIGH_IMPACT_EVENTS key: FOMC, CPI, NFP, GDP
+# e.g. {'event': 'FOMC', 'time': 'YYYY-MM-DDTHH:MM'}
+ECONOMIC_EVENTS = []
+
 # Assets
 ASSETS_CONFIG = {
     'BTC': {
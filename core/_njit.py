@@ -0,0 +1,18 @@
+"""
+Optional numba JIT - falls back to plain Python when numba is missing
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, bare or with options"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -4,6 +4,8 @@ Prevents trading in bad market conditions
 """
 
 import logging
+import math
+import time
 from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,47 @@ class MarketContext:
         self.iv_threshold_extreme = 120
         self.max_both_sides_bleeding = -30
         
+        # EWMA realized volatility per asset (RiskMetrics lambda)
+        self.ewma_lambda = 0.94
+        # Per-tick log-return sigma. Ticks come once per ~45s trading cycle,
+        # where BTC/ETH at ~3% daily vol sit near 0.0007 - 0.002 is ~3x that
+        self.volatility_spike_threshold = 0.002
+        # Returns needed before the EWMA is trusted over the trades fallback
+        self.min_vol_samples = 10
+        # A longer gap (sleep, stalled cycle) spans too much time for one
+        # return - start the estimate over
+        self.max_tick_gap_seconds = 180
+        self._ewma_var: Dict[str, float] = {}
+        self._ewma_count: Dict[str, int] = {}
+        self._last_price: Dict[str, float] = {}
+        self._last_tick_time: Dict[str, float] = {}
+        
+    def ingest_tick(self, asset: str, price: float):
+        """Update EWMA variance with a new price - O(1) per tick"""
+        if price <= 0:
+            return
+        
+        now = time.monotonic()
+        last = self._last_price.get(asset)
+        last_time = self._last_tick_time.get(asset)
+        self._last_price[asset] = price
+        self._last_tick_time[asset] = now
+        
+        if last_time is not None and now - last_time > self.max_tick_gap_seconds:
+            self._ewma_var.pop(asset, None)
+            self._ewma_count.pop(asset, None)
+            return
+        if not last:
+            return
+        
+        ret = math.log(price / last)
+        var = self._ewma_var.get(asset)
+        if var is None:
+            self._ewma_var[asset] = ret * ret
+        else:
+            self._ewma_var[asset] = self.ewma_lambda * var + (1 - self.ewma_lambda) * ret * ret
+        self._ewma_count[asset] = self._ewma_count.get(asset, 0) + 1
+        
     def analyze(self, market_data: Dict) -> Dict:
         """
         Analyze market context and return trading permission
@@ -103,6 +146,10 @@ class MarketContext:
     
     def _check_volatility_spike(self, data: Dict) -> bool:
         """Check for recent volatility spike"""
+        asset = data.get('asset')
+        if self._ewma_count.get(asset, 0) >= self.min_vol_samples:
+            return math.sqrt(self._ewma_var[asset]) > self.volatility_spike_threshold
+        
         recent_trades = data.get('recent_trades', [])
         if len(recent_trades) < 10:
             return False
@@ -114,4 +161,4 @@ class MarketContext:
         returns = [abs(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices))]
         avg_volatility = sum(returns) / len(returns)
         
-        return avg_volatility > 0.002
+        return avg_volatility > self.volatility_spike_threshold
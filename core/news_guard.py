@@ -2,12 +2,33 @@
 News Guard - Economic Event & Expiry Filter
 """
 
+import calendar
 import logging
-from typing import Dict, Tuple
-from datetime import datetime, timedelta
+import time
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Shared verdicts for outcomes without runtime data - returned, not rebuilt
+_ALLOWED = (True, "No high-impact events detected")
+_NO_EVENT = (False, "")
+_EXPIRY_AFTER_NOON = (False, "Weekly expiry day after noon - high gamma risk")
+_EXPIRY_MORNING = (True, "Weekly expiry day morning - caution")
+_MONTHLY_EXPIRY_DAY = (False, "Monthly expiry day - avoid")
+_MONTHLY_EXPIRY_EVE = (False, "Monthly expiry eve - pin risk")
+_EXPIRY_LOW = (True, "Expiry risk low")
+
+@lru_cache(maxsize=64)
+def _last_friday_ordinal(year: int, month: int) -> int:
+    """Date ordinal of the last Friday of a month"""
+    last_day = calendar.monthrange(year, month)[1]
+    last = date(year, month, last_day)
+    return last.toordinal() - (last.weekday() - 4) % 7
+
 class NewsGuard:
     HIGH_IMPACT_EVENTS = {
         'FOMC': {
@@ -39,16 +60,131 @@ class NewsGuard:
     def __init__(self):
         self.active_events = []
         self.last_check = None
+        self.cache_ttl = 30
+        # asset -> (computed_ts, verdict)
+        self._guard_cache: Dict[Optional[str], Tuple[float, Tuple[bool, str]]] = {}
+        # Sorted, merged scheduled avoid windows (epoch seconds)
+        self._window_starts: Optional[np.ndarray] = None
+        self._window_ends: Optional[np.ndarray] = None
+        self._window_verdicts: List[Tuple[bool, str]] = []
+        # (event key, epoch seconds) from load_schedule
+        self._schedule: List[Tuple[str, int]] = []
+        self._schedule_end: Optional[int] = None
+        self._schedule_warned = False
+        
+    def load_schedule(self, events: List[Dict[str, str]]):
+        """Load scheduled releases: [{'event': 'FOMC', 'time': 'YYYY-MM-DDTHH:MM'}] (UTC)"""
+        schedule = []
+        for entry in events:
+            key = entry.get('event')
+            if key not in self.HIGH_IMPACT_EVENTS:
+                logger.warning(f"Unknown scheduled event {key!r} - skipped")
+                continue
+            try:
+                event_ts = int(np.datetime64(entry['time'], 'm').astype('datetime64[s]').astype('int64'))
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Bad time for scheduled {key}: {e}")
+                continue
+            schedule.append((key, event_ts))
+        
+        self._schedule = schedule
+        self._schedule_end = max((ts for _, ts in schedule), default=None)
+        self._schedule_warned = False
+        self._window_starts = None
+        self._guard_cache.clear()
+        
+        if not schedule:
+            logger.warning("⚠️ No economic events scheduled - event windows disabled")
         
     async def check_trading_allowed(self, asset: str = None) -> Tuple[bool, str]:
         """Check if trading allowed"""
-        now = datetime.utcnow()
+        return self._fast_check(time.time(), asset)
+    
+    def check_trading_allowed_sync(self, asset: str = None) -> Tuple[bool, str]:
+        """Synchronous variant for callers outside the event loop"""
+        return self._fast_check(time.time(), asset)
+    
+    def _fast_check(self, now_ts: float, asset: str = None) -> Tuple[bool, str]:
+        """Return cached guard result, re-evaluating when stale"""
+        cached = self._guard_cache.get(asset)
+        if cached is not None and now_ts - cached[0] < self.cache_ttl:
+            return cached[1]
+        
+        verdict = self._evaluate_guards(now_ts, asset)
+        self._guard_cache[asset] = (now_ts, verdict)
+        return verdict
+    
+    def check_trading_allowed_batch(self, assets: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """Check several assets, sharing the asset-independent work"""
+        now_ts = time.time()
+        
+        blocked = self._scheduled_block(now_ts)
+        if blocked:
+            verdict = (False, blocked)
+            return {asset: verdict for asset in assets}
+        
+        expiry_verdict = self._expiry_verdict()
+        return {asset: expiry_verdict for asset in assets}
+    
+    def _evaluate_guards(self, now_ts: float, asset: str = None) -> Tuple[bool, str]:
+        """Run scheduled and expiry checks"""
+        blocked = self._scheduled_block(now_ts)
+        if blocked:
+            return False, blocked
+        
+        return self._expiry_verdict()
+    
+    def _scheduled_block(self, now_ts: float) -> Optional[str]:
+        """Reason if a scheduled event blocks every asset, else None"""
+        near_event, event_msg = self._is_near_event(now_ts)
+        return event_msg if near_event else None
+    
+    def _expiry_verdict(self) -> Tuple[bool, str]:
+        expiry_verdict = self.check_expiry_risk()
+        if not expiry_verdict[0]:
+            return expiry_verdict
+        
+        return _ALLOWED
+    
+    def _rebuild_windows(self):
+        """Flatten every scheduled release x avoid window into sorted intervals"""
+        intervals = []
+        for key, event_ts in self._schedule:
+            event = self.HIGH_IMPACT_EVENTS[key]
+            intervals.append((
+                event_ts - event['avoid_before_hours'] * 3600,
+                event_ts + event['avoid_after_hours'] * 3600,
+                f"{event['name']} window - avoid trading",
+            ))
+        
+        intervals.sort()
+        
+        # Merge overlaps so only the window starting just before now can cover it
+        merged = []
+        for start, end, msg in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end, msg])
+        
+        self._window_starts = np.array([w[0] for w in merged], dtype='int64')
+        self._window_ends = np.array([w[1] for w in merged], dtype='int64')
+        self._window_verdicts = [(True, w[2]) for w in merged]
+    
+    def _is_near_event(self, now_ts: float) -> Tuple[bool, str]:
+        """Check if inside a scheduled event avoid window - O(log N)"""
+        if self._window_starts is None:
+            self._rebuild_windows()
+        
+        if not self._schedule_warned and self._schedule_end is not None and now_ts > self._schedule_end:
+            self._schedule_warned = True
+            logger.warning("⚠️ Economic event schedule exhausted - update ECONOMIC_EVENTS")
         
-        expiry_ok, expiry_msg = self.check_expiry_risk()
-        if not expiry_ok:
-            return False, expiry_msg
+        idx = int(np.searchsorted(self._window_starts, now_ts, side='right')) - 1
+        if idx >= 0 and self._window_ends[idx] >= now_ts:
+            return self._window_verdicts[idx]
         
-        return True, "No high-impact events detected"
+        return _NO_EVENT
     
     def check_expiry_risk(self) -> Tuple[bool, str]:
         """Check options expiry risk"""
@@ -56,10 +192,10 @@ class NewsGuard:
         
         if now.weekday() == 4:
             if now.hour >= 12:
-                return False, "Weekly expiry day after noon - high gamma risk"
+                return _EXPIRY_AFTER_NOON
             
             if now.hour >= 8:
-                return True, "Weekly expiry day morning - caution"
+                return _EXPIRY_MORNING
         
         days_to_friday = (4 - now.weekday()) % 7
         if days_to_friday == 0:
@@ -69,22 +205,16 @@ class NewsGuard:
         
         if self.is_monthly_expiry():
             if now.weekday() == 4:
-                return False, "Monthly expiry day - avoid"
+                return _MONTHLY_EXPIRY_DAY
             elif now.weekday() == 3 and now.hour >= 20:
-                return False, "Monthly expiry eve - pin risk"
+                return _MONTHLY_EXPIRY_EVE
         
-        return True, "Expiry risk low"
+        return _EXPIRY_LOW
     
     def is_monthly_expiry(self) -> bool:
         """Check if this week is monthly expiry"""
-        today = datetime.now()
-        next_month = today.replace(day=28) + timedelta(days=4)
-        last_day = next_month - timedelta(days=next_month.day)
-        last_friday = last_day
-        while last_friday.weekday() != 4:
-            last_friday -= timedelta(days=1)
-        
-        days_diff = (last_friday.date() - today.date()).days
+        today = datetime.now().date()
+        days_diff = _last_friday_ordinal(today.year, today.month) - today.toordinal()
         return 0 <= days_diff <= 3
     
     def get_next_event_warning(self) -> str:
@@ -3,16 +3,22 @@ Performance Tracker with Circuit Breaker
 """
 
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import deque
+from collections import deque, defaultdict
 
 logger = logging.getLogger(__name__)
 
+def _new_bucket() -> Dict:
+    return {'trades': 0, 'wins': 0, 'losses': 0, 'pnl': 0.0, 'hard_losses': 0}
+
 class PerformanceTracker:
+    BUCKET_RETENTION_DAYS = 30
+    MAX_TRADE_HISTORY = 10000
+    
     def __init__(self):
-        self.trades = []
-        self.daily_trades = []
+        # Recent trades for inspection only - stats use lifetime counters
+        self.trades = deque(maxlen=self.MAX_TRADE_HISTORY)
         self.consecutive_losses = 0
         self.consecutive_wins = 0
         self.max_consecutive_losses = 3
@@ -20,24 +26,53 @@ class PerformanceTracker:
         self.win_rate_threshold = 0.55
         self.profit_factor_threshold = 1.2
         
+        # Running aggregates - stats are O(1) instead of rescanning trades
+        self._wins = 0
+        self._losses = 0
+        self._total_profit = 0.0
+        self._total_loss = 0.0  # magnitude of losing PnL
+        self._total_pnl = 0.0
+        
+        # Per-day aggregates keyed by date ordinal
+        self._bucketed: Dict[int, Dict] = defaultdict(_new_bucket)
+        self._last_bucket_key = datetime.now().date().toordinal()
+        
     def add_trade(self, result: str, pnl: float, asset: str = ''):
         """Record trade result"""
+        now = datetime.now()
         trade = {
             'result': result,
             'pnl': pnl,
             'asset': asset,
-            'time': datetime.now(),
-            'date': datetime.now().date()
+            'time': now,
+            'date': now.date()
         }
         
+        bucket_key = trade['date'].toordinal()
+        if bucket_key != self._last_bucket_key:
+            self._prune_buckets(bucket_key)
+            self._last_bucket_key = bucket_key
+        bucket = self._bucketed[bucket_key]
+        
         self.trades.append(trade)
-        self.daily_trades.append(trade)
+        
+        self._total_pnl += pnl
+        bucket['trades'] += 1
+        bucket['pnl'] += pnl
         
         # Update consecutive counters
         if result == 'win':
+            self._wins += 1
+            bucket['wins'] += 1
+            self._total_profit += pnl
             self.consecutive_wins += 1
             self.consecutive_losses = 0
         else:
+            self._losses += 1
+            bucket['losses'] += 1
+            if result == 'loss':
+                bucket['hard_losses'] += 1
+                self._total_loss += abs(pnl)
             self.consecutive_losses += 1
             self.consecutive_wins = 0
         
@@ -54,8 +89,7 @@ class PerformanceTracker:
             }
         
         # Check daily loss limit
-        daily_losses = sum(1 for t in self.daily_trades if t['result'] == 'loss')
-        if daily_losses >= self.max_daily_losses:
+        if bucket['hard_losses'] >= self.max_daily_losses:
             return {
                 'action': 'daily_limit',
                 'message': f'{self.max_daily_losses} losses today',
@@ -66,74 +100,66 @@ class PerformanceTracker:
     
     def get_stats(self) -> Dict:
         """Get overall performance stats"""
-        if not self.trades:
+        total_trades = self._wins + self._losses
+        if not total_trades:
             return {
                 'total_trades': 0,
                 'wins': 0,
                 'losses': 0,
                 'win_rate': 0,
-                'profit_factor': 0
+                'profit_factor': None
             }
         
-        wins = sum(1 for t in self.trades if t['result'] == 'win')
-        losses = len(self.trades) - wins
-        
-        win_trades = [t for t in self.trades if t['result'] == 'win']
-        loss_trades = [t for t in self.trades if t['result'] == 'loss']
-        
-        total_profit = sum(t['pnl'] for t in win_trades) if win_trades else 0
-        total_loss = abs(sum(t['pnl'] for t in loss_trades)) if loss_trades else 1
-        
         return {
-            'total_trades': len(self.trades),
-            'wins': wins,
-            'losses': losses,
-            'win_rate': wins / len(self.trades),
-            'profit_factor': total_profit / total_loss if total_loss > 0 else 0,
-            'total_pnl': sum(t['pnl'] for t in self.trades),
+            'total_trades': total_trades,
+            'wins': self._wins,
+            'losses': self._losses,
+            'win_rate': self._wins / total_trades,
+            'profit_factor': self.get_profit_factor(),
+            'total_pnl': self._total_pnl,
             'consecutive_losses': self.consecutive_losses,
             'consecutive_wins': self.consecutive_wins
         }
     
     def today_stats(self) -> Dict:
         """Get today's stats"""
-        today = datetime.now().date()
-        today_trades = [t for t in self.daily_trades if t['date'] == today]
-        
-        if not today_trades:
+        bucket = self._bucketed.get(datetime.now().date().toordinal())
+        if not bucket:
             return {'trades': 0, 'wins': 0, 'losses': 0, 'pnl': 0}
         
-        wins = sum(1 for t in today_trades if t['result'] == 'win')
-        
         return {
-            'trades': len(today_trades),
-            'wins': wins,
-            'losses': len(today_trades) - wins,
-            'pnl': sum(t['pnl'] for t in today_trades)
+            'trades': bucket['trades'],
+            'wins': bucket['wins'],
+            'losses': bucket['losses'],
+            'pnl': bucket['pnl']
         }
     
     def get_win_rate(self) -> float:
         """Get current win rate"""
-        if not self.trades:
+        total_trades = self._wins + self._losses
+        if not total_trades:
             return 0
-        wins = sum(1 for t in self.trades if t['result'] == 'win')
-        return wins / len(self.trades)
+        return self._wins / total_trades
     
-    def get_profit_factor(self) -> float:
-        """Get profit factor"""
-        win_trades = [t for t in self.trades if t['result'] == 'win']
-        loss_trades = [t for t in self.trades if t['result'] == 'loss']
-        
-        total_profit = sum(t['pnl'] for t in win_trades)
-        total_loss = abs(sum(t['pnl'] for t in loss_trades))
-        
-        return total_profit / total_loss if total_loss > 0 else 0
+    def get_profit_factor(self) -> Optional[float]:
+        """Get profit factor - None (n/a) until there is a losing trade"""
+        if self._total_loss > 0:
+            return self._total_profit / self._total_loss
+        return None
     
     def reset_daily(self):
         """Reset daily counters"""
-        self.daily_trades = []
+        today_key = datetime.now().date().toordinal()
+        self._bucketed.pop(today_key, None)
+        self._prune_buckets(today_key)
         logger.info("Daily performance counters reset")
     
+    def _prune_buckets(self, today_key: int):
+        """Drop day buckets older than the retention window"""
+        cutoff = today_key - self.BUCKET_RETENTION_DAYS
+        for key in [k for k in self._bucketed if k < cutoff]:
+            del self._bucketed[key]
+    
     def should_reduce_size(self) -> Tuple[bool, float]:
         """Check if position size should be reduced"""
         stats = self.get_stats()
@@ -143,7 +169,8 @@ class PerformanceTracker:
             return True, 0.5
         
         # Reduce size if profit factor poor
-        if stats['profit_factor'] < self.profit_factor_threshold and len(self.trades) > 10:
+        profit_factor = stats['profit_factor']
+        if profit_factor is not None and profit_factor < self.profit_factor_threshold and len(self.trades) > 10:
             return True, 0.5
         
         return False, 1.0
@@ -6,76 +6,150 @@ import random
 import time
 import asyncio
 import aiohttp
-from typing import Dict, Optional
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 class StealthRequest:
-    USER_AGENTS = [
+    USER_AGENTS = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
-    ]
+    )
+    
+    # One read-only header dict per User-Agent, built once at class creation
+    _HEADER_VARIANTS = tuple(
+        MappingProxyType({
+            'User-Agent': ua,
+            'Accept': 'application/json',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+        for ua in USER_AGENTS
+    )
+    
+    MAX_RETRIES = 5
     
     def __init__(self, config: Dict):
         self.config = config
-        self.last_request_time = 0
-        self.request_count = 0
+        self.last_request_time = 0.0
+        self._req_times: deque = deque()
         self.min_delay = config.get('min_request_delay', 1.0)
         self.max_delay = config.get('max_request_delay', 5.0)
         self.max_per_minute = config.get('max_requests_per_minute', 15)
+        self.request_timeout = config.get('request_timeout', 30)
+        self.connection_limit = config.get('connection_limit', 20)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create one pooled session, reused across requests"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the pooled session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
     async def _apply_jitter(self):
         if not self.config.get('enable_jitter', True):
             return
-            
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
         
-        base_delay = random.uniform(self.min_delay, self.max_delay)
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
         
-        if self.request_count > self.max_per_minute:
-            base_delay *= 2
-            logger.warning("Rate limit approaching, backing off...")
+        # Check, wait and record under one lock so concurrent callers
+        # (get_many, gathered get()s) can't all pass against the same state
+        async with self._rate_lock:
+            now = time.monotonic()
             
-        if time_since_last < base_delay:
-            await asyncio.sleep(base_delay - time_since_last)
+            # Sliding 60s window of request timestamps
+            while True:
+                while self._req_times and self._req_times[0] + 60 <= now:
+                    self._req_times.popleft()
+                if len(self._req_times) < self.max_per_minute:
+                    break
+                free_at = self._req_times[0] + 60
+                logger.warning(f"Rate limit reached, waiting {free_at - now:.1f}s...")
+                await asyncio.sleep(free_at - now)
+                now = max(time.monotonic(), free_at)
             
-        self.last_request_time = time.time()
-        self.request_count += 1
-        
-        if self.request_count >= self.max_per_minute:
-            await asyncio.sleep(60)
-            self.request_count = 0
+            base_delay = random.uniform(self.min_delay, self.max_delay)
+            time_since_last = now - self.last_request_time
+            
+            if time_since_last < base_delay:
+                await asyncio.sleep(base_delay - time_since_last)
+                
+            self.last_request_time = time.monotonic()
+            self._req_times.append(self.last_request_time)
     
-    def _get_headers(self) -> Dict:
-        return {
-            'User-Agent': random.choice(self.USER_AGENTS),
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+    def _get_headers(self) -> Mapping[str, str]:
+        """Random pre-built header set - shared, do not mutate"""
+        return self._HEADER_VARIANTS[random.randrange(len(self._HEADER_VARIANTS))]
     
     async def get(self, url: str, params: Optional[Dict] = None) -> Dict:
-        await self._apply_jitter()
+        return await self._request('GET', url, params=params)
+    
+    async def get_many(self, urls: List[str], params: Optional[Dict] = None) -> List[Dict]:
+        """Fetch several URLs concurrently; _apply_jitter serialises them against the shared rate limit"""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(max(1, self.max_per_minute // 2))
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
+        async def _one(url: str) -> Dict:
+            async with self._sem:
+                return await self.get(url, params)
+        
+        return await asyncio.gather(*[_one(url) for url in urls], return_exceptions=True)
+    
+    async def post(self, url: str, data: Optional[Dict] = None) -> Dict:
+        return await self._request('POST', url, json=data)
+    
+    async def _request(self, method: str, url: str, *,
+                       params: Optional[Dict] = None, json: Optional[Dict] = None) -> Dict:
+        """Shared jitter -> session -> retry pipeline for all verbs"""
+        for attempt in range(self.MAX_RETRIES):
+            await self._apply_jitter()
+            
+            try:
+                session = await self._get_session()
+                async with session.request(
+                    method,
                     url, 
                     headers=self._get_headers(), 
-                    params=params, 
-                    timeout=aiohttp.ClientTimeout(total=30)
+                    params=params,
+                    json=json
                 ) as response:
                     
                     if response.status == 429:
-                        logger.warning("Rate limited, waiting 60s...")
-                        await asyncio.sleep(60)
-                        return await self.get(url, params)
+                        # No point backing off before giving up
+                        if attempt < self.MAX_RETRIES - 1:
+                            wait = min(60 * 2 ** attempt, 600)
+                            logger.warning(f"Rate limited, waiting {wait}s...")
+                            await asyncio.sleep(wait)
+                        continue
                     
                     response.raise_for_status()
                     return await response.json()
                     
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return {}
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                logger.error(f"Request failed (attempt {attempt + 1}): {e}")
+                if attempt < self.MAX_RETRIES - 1:
+                    await asyncio.sleep(2 ** attempt)
+                    
+            except Exception as e:
+                logger.error(f"Request failed: {e}")
+                return {}
+        
+        logger.error(f"Giving up after {self.MAX_RETRIES} attempts: {url}")
+        return {}
@@ -4,13 +4,53 @@ Bot only runs during golden hours to save Railway resources
 """
 
 import logging
+import time as _time
+from array import array
+from bisect import bisect_right
 from typing import Dict, Tuple, Optional
 from datetime import datetime, time, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
-IST = pytz.timezone('Asia/Kolkata')
+IST = ZoneInfo('Asia/Kolkata')
+_GOLDEN_START_SEC = 19 * 3600  # 7 PM IST
+_DAY_SEC = 86400
+
+_US_OPEN_SESSION = {
+    'session': 'US Market Open',
+    'quality': 'excellent',
+    'priority': 1
+}
+
+_REGULAR_SESSION = {
+    'session': 'Regular',
+    'quality': 'moderate',
+    'priority': 3
+}
+
+# IST wall clock fields, refreshed at most once per second
+_TZ_CACHE = {'monotonic': -1e9, 'hour': 0, 'minute': 0, 'weekday': 0, 'date': None}
+
+def _ist_now() -> Dict:
+    """Cached IST hour/minute/weekday/date - avoids tz-aware now() per call"""
+    mono = _time.monotonic()
+    if mono - _TZ_CACHE['monotonic'] > 1.0:
+        now = datetime.now(IST)
+        _TZ_CACHE.update(
+            monotonic=mono,
+            hour=now.hour,
+            minute=now.minute,
+            weekday=now.weekday(),
+            date=now.date()
+        )
+    return _TZ_CACHE
+
+# Minute-of-day (IST) -> session info; 7:00 PM - 9:30 PM inclusive is US open
+_SESSION_TABLE = tuple(
+    _US_OPEN_SESSION if 19 * 60 <= minute <= 21 * 60 + 30 else _REGULAR_SESSION
+    for minute in range(1440)
+)
 
 class TimeFilter:
     def __init__(self):
@@ -26,95 +66,108 @@ class TimeFilter:
         # Days to trade (0=Monday, 4=Friday)
         self.trading_days = [0, 1, 2, 3]  # Mon-Thu only
         
+        # Integer seconds-of-day bounds for the hot-path checks, sorted by start
+        ordered = sorted(self.golden_hours)
+        self._golden_ranges = tuple(
+            (s.hour * 3600 + s.minute * 60, e.hour * 3600 + e.minute * 60)
+            for s, e in ordered
+        )
+        self._golden_start_times = tuple(s for s, _ in ordered)
+        self._starts = array('i', [s for s, _ in self._golden_ranges])
+        self._ends = array('i', [e for _, e in self._golden_ranges])
+        self._trading_days_set = frozenset(self.trading_days)
+        
+        # (epoch minute, decision, computed_at) - IST midnight and the golden
+        # hour bounds fall on whole minutes, so one decision holds per minute
+        self._run_cache: Tuple[int, Optional[Tuple[bool, Optional[int], str]], float] = (-1, None, 0.0)
+        
     def should_bot_run(self) -> Tuple[bool, Optional[int], str]:
         """
         Main check - should bot be running at all?
         Returns: (should_run, sleep_seconds, reason)
         """
-        now = datetime.now(self.ist)
+        now_ts = _time.time()
+        bucket = int(now_ts) // 60
+        cached_bucket, cached, cached_at = self._run_cache
+        if bucket == cached_bucket:
+            should_run, sleep_seconds, reason = cached
+            if sleep_seconds is not None:
+                sleep_seconds = max(0, sleep_seconds - int(now_ts - cached_at))
+            return should_run, sleep_seconds, reason
+        
+        result = self._evaluate_run(now_ts)
+        self._run_cache = (bucket, result, now_ts)
+        return result
+    
+    def _evaluate_run(self, now_ts: float) -> Tuple[bool, Optional[int], str]:
+        """Uncached should_bot_run decision for the given epoch time"""
+        now = datetime.fromtimestamp(now_ts, self.ist)
         weekday = now.weekday()
-        current_time = now.time()
+        sec_of_day = now.hour * 3600 + now.minute * 60 + now.second
         
         # Check if trading day
-        if weekday not in self.trading_days:
+        if weekday not in self._trading_days_set:
             # Calculate sleep until next Monday 7 PM
             if weekday == 4:  # Friday
-                sleep_seconds = self._seconds_until_monday_7pm(now)
+                sleep_seconds = self._seconds_until_monday_7pm(weekday, sec_of_day)
                 return False, sleep_seconds, "Weekend - bot sleeping until Monday"
-            elif weekday in [5, 6]:  # Saturday/Sunday
-                sleep_seconds = self._seconds_until_monday_7pm(now)
+            elif weekday in (5, 6):  # Saturday/Sunday
+                sleep_seconds = self._seconds_until_monday_7pm(weekday, sec_of_day)
                 return False, sleep_seconds, "Weekend - bot sleeping"
             else:
                 return False, 3600, "Non-trading day"
         
         # Check if within golden hours
-        in_golden_hour, next_window = self._check_golden_hours(current_time)
+        in_golden_hour, next_window = self._check_golden_hours(sec_of_day)
         
         if not in_golden_hour:
             if next_window:
-                sleep_seconds = self._seconds_until_time(now, next_window)
+                sleep_seconds = self._seconds_until_time(sec_of_day, next_window)
                 return False, sleep_seconds, f"Outside golden hours - sleeping until {next_window}"
             else:
-                sleep_seconds = self._seconds_until_tomorrow_7pm(now)
+                sleep_seconds = self._seconds_until_tomorrow_7pm(weekday, sec_of_day)
                 return False, sleep_seconds, "Golden hours over - sleeping until tomorrow"
         
         return True, None, "Golden hour - trading active"
     
-    def _check_golden_hours(self, current_time: time) -> Tuple[bool, Optional[time]]:
-        """Check if current time is in golden hours"""
-        for start, end in self.golden_hours:
-            if start <= current_time <= end:
-                return True, None
+    def _check_golden_hours(self, sec_of_day: int) -> Tuple[bool, Optional[time]]:
+        """Check if current second-of-day is in golden hours"""
+        i = bisect_right(self._starts, sec_of_day) - 1
+        if i >= 0 and sec_of_day <= self._ends[i]:
+            return True, None
         
-        # Find next window today
-        for start, end in self.golden_hours:
-            if current_time < start:
-                return False, start
+        # Next window today, if any
+        if i + 1 < len(self._starts):
+            return False, self._golden_start_times[i + 1]
         
         return False, None
     
-    def _seconds_until_time(self, now: datetime, target_time: time) -> int:
+    def _seconds_until_time(self, sec_of_day: int, target_time: time) -> int:
         """Calculate seconds until target time today"""
-        target = now.replace(hour=target_time.hour, minute=target_time.minute, second=0)
-        if target < now:
-            target += timedelta(days=1)
-        return int((target - now).total_seconds())
+        delta = target_time.hour * 3600 + target_time.minute * 60 - sec_of_day
+        if delta < 0:
+            delta += _DAY_SEC
+        return delta
     
-    def _seconds_until_tomorrow_7pm(self, now: datetime) -> int:
+    def _seconds_until_tomorrow_7pm(self, weekday: int, sec_of_day: int) -> int:
         """Calculate seconds until tomorrow 7 PM"""
-        tomorrow = now + timedelta(days=1)
-        target = tomorrow.replace(hour=19, minute=0, second=0, microsecond=0)
-        if target.weekday() >= 5:
-            target += timedelta(days=(7 - target.weekday()))
-        return int((target - now).total_seconds())
+        days = 1
+        tomorrow = (weekday + 1) % 7
+        if tomorrow >= 5:
+            days += 7 - tomorrow
+        return days * _DAY_SEC + _GOLDEN_START_SEC - sec_of_day
     
-    def _seconds_until_monday_7pm(self, now: datetime) -> int:
+    def _seconds_until_monday_7pm(self, weekday: int, sec_of_day: int) -> int:
         """Calculate seconds until next Monday 7 PM"""
-        days_until_monday = (7 - now.weekday()) % 7
+        days_until_monday = (7 - weekday) % 7
         if days_until_monday == 0:
             days_until_monday = 7
-        target = now + timedelta(days=days_until_monday)
-        target = target.replace(hour=19, minute=0, second=0, microsecond=0)
-        return int((target - now).total_seconds())
+        return days_until_monday * _DAY_SEC + _GOLDEN_START_SEC - sec_of_day
     
     def is_best_time(self, asset: str = None) -> Tuple[bool, Dict]:
         """Legacy method - kept for compatibility"""
-        now = datetime.now(self.ist)
-        current_hour = now.hour
-        current_minute = now.minute
-        
-        if 19 <= current_hour < 21 or (current_hour == 21 and current_minute <= 30):
-            return True, {
-                'session': 'US Market Open',
-                'quality': 'excellent',
-                'priority': 1
-            }
-        
-        return True, {
-            'session': 'Regular',
-            'quality': 'moderate',
-            'priority': 3
-        }
+        clock = _ist_now()
+        return True, _SESSION_TABLE[clock['hour'] * 60 + clock['minute']]
     
     def is_high_risk_time(self) -> Tuple[bool, str]:
         """Legacy - now handled by should_bot_run"""
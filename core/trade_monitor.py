@@ -5,29 +5,81 @@ Integrated with Adaptive Optimizer
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import count
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from enum import Enum
+from enum import IntFlag, auto
 
 from tg_bot.bot import AlphaTelegramBot
 from core.adaptive_optimizer import adaptive_optimizer
+from core.time_filter import TimeFilter
 
 logger = logging.getLogger(__name__)
 
-class AlertType(Enum):
-    SL_APPROACHING = "sl_approaching"
-    TP1_APPROACHING = "tp1_approaching"
-    TP2_APPROACHING = "tp2_approaching"
-    BREAKEVEN_TRIGGER = "breakeven_trigger"
-    TRAIL_STOP_TRIGGER = "trail_stop_trigger"
-    TIME_EXPIRING = "time_expiring"
-    TIME_EXPIRED = "time_expired"
-    REVERSAL_DETECTED = "reversal_detected"
-    VOLATILITY_SPIKE = "volatility_spike"
-    PARTIAL_CLOSE = "partial_close"
+class AlertType(IntFlag):
+    """Alert kinds - flags so a trade's sent alerts fit in one int"""
+    SL_APPROACHING = auto()
+    TP1_APPROACHING = auto()
+    TP2_APPROACHING = auto()
+    BREAKEVEN_TRIGGER = auto()
+    TRAIL_STOP_TRIGGER = auto()
+    TIME_EXPIRING = auto()
+    TIME_EXPIRED = auto()
+    REVERSAL_DETECTED = auto()
+    VOLATILITY_SPIKE = auto()
+    PARTIAL_CLOSE = auto()
 
-@dataclass
+# (alert type, extra fields) queued by the sync checks, sent once per tick
+AlertEvent = Tuple[AlertType, dict]
+# (reason, result) for a trade the checks decided to close
+CloseRequest = Tuple[str, str]
+
+# Once-per-trade proximity alerts; when all are sent the distance checks are skipped
+_PROXIMITY_ALERTS = AlertType.SL_APPROACHING | AlertType.TP1_APPROACHING
+
+_ALERT_EMOJI = {
+    AlertType.SL_APPROACHING: '🚨',
+    AlertType.TP1_APPROACHING: '🎯',
+    AlertType.BREAKEVEN_TRIGGER: '✅',
+    AlertType.TRAIL_STOP_TRIGGER: '📈',
+    AlertType.PARTIAL_CLOSE: '🔒',
+    AlertType.TIME_EXPIRING: '⏰',
+    AlertType.TIME_EXPIRED: '⏰'
+}
+
+# Per-trade block shared by every alert, filled with str.format_map
+_ALERT_TRADE_BLOCK = (
+    "Asset: {asset}\n"
+    "Direction: {direction}\n"
+    "Entry: {entry:,.2f}\n"
+    "Current: {current:,.2f}\n"
+    "P&L: {pnl:+.2f}%\n\n"
+)
+
+def _build_alert_templates(thresholds: Dict) -> Dict[AlertType, str]:
+    """Full message template for every alert type - static text baked in"""
+    templates = {}
+    for alert_type in AlertType:
+        emoji = _ALERT_EMOJI.get(alert_type, '⚠️')
+        header = f"{emoji} <b>{alert_type.name.replace('_', ' ')}</b>\n\n"
+        footer = f"<b>{thresholds.get(alert_type, {}).get('message', 'Alert')}</b>\n"
+        templates[alert_type] = (
+            header.replace('{', '{{').replace('}', '}}')
+            + _ALERT_TRADE_BLOCK
+            + footer.replace('{', '{{').replace('}', '}}')
+        )
+    return templates
+
+@lru_cache(maxsize=64)
+def _field_label(key: str) -> str:
+    """'current_pnl' -> 'Current Pnl'"""
+    return key.replace('_', ' ').title()
+
+@dataclass(slots=True, eq=False)
 class ActiveTrade:
     asset: str
     direction: str
@@ -40,7 +92,8 @@ class ActiveTrade:
     position_size: float
     entry_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     status: str = "open"
-    alerts_sent: List[AlertType] = field(default_factory=list)
+    is_open: bool = True
+    alerts_sent: AlertType = AlertType(0)
     current_price: float = 0.0
     pnl_percent: float = 0.0
     auto_manage: bool = True
@@ -56,19 +109,36 @@ class ActiveTrade:
     setup_key: str = ""
     regime: str = "unknown"
     mtf_score: float = 0.0
+    
+    # Assigned by TradeMonitor.add_trade; several trades may share an asset
+    trade_id: int = 0
+    
+    # Derived once: +1 long / -1 short, and 1/entry for multiply-not-divide math
+    _sign: float = field(init=False, repr=False, default=1.0)
+    _inv_entry: float = field(init=False, repr=False, default=0.0)
+    # Trailing stop sits 1% behind price: below for longs, above for shorts
+    _trail_mult: float = field(init=False, repr=False, default=0.99)
+    
+    def __post_init__(self):
+        self._sign = 1.0 if self.direction == 'long' else -1.0
+        self._inv_entry = 1.0 / self.entry_price if self.entry_price else 0.0
+        self._trail_mult = 0.99 if self.direction == 'long' else 1.01
+
+    def mark_closed(self, status: str):
+        """Record why the trade closed and take it out of the open set"""
+        self.status = status
+        self.is_open = False
 
     def update_price(self, price: float):
         """Update current price and PnL"""
         self.current_price = price
-        
-        if self.direction == 'long':
-            self.pnl_percent = ((price - self.entry_price) / self.entry_price) * 100
-        else:
-            self.pnl_percent = ((self.entry_price - price) / self.entry_price) * 100
+        self.pnl_percent = self._sign * (price - self.entry_price) * self._inv_entry * 100.0
     
-    def get_hold_time_minutes(self) -> float:
+    def get_hold_time_minutes(self, now: Optional[datetime] = None) -> float:
         """Calculate how long trade has been open"""
-        return (datetime.now(timezone.utc) - self.entry_time).total_seconds() / 60
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return (now - self.entry_time).total_seconds() / 60
 
 class TradeMonitor:
     """Monitors active trades with auto-management"""
@@ -103,23 +173,55 @@ class TradeMonitor:
         }
     }
     
-    def __init__(self, telegram_bot: AlphaTelegramBot):
-        self.active_trades: List[ActiveTrade] = []
+    _ALERT_TEMPLATES = _build_alert_templates(ALERT_THRESHOLDS)
+    
+    # Streamed prices wake the loop; the poll below is only a heartbeat fallback
+    HEARTBEAT_SECONDS = 5.0
+    PUSH_MIN_INTERVAL = 0.5
+    # Queued messages sent together per burst - well inside Telegram's per-second limit
+    SEND_BATCH_SIZE = 5
+    
+    # Thresholds the per-tick checks read, bound once from ALERT_THRESHOLDS
+    _SL_ALERT_DISTANCE = ALERT_THRESHOLDS[AlertType.SL_APPROACHING]['distance_percent']
+    _TP1_ALERT_DISTANCE = ALERT_THRESHOLDS[AlertType.TP1_APPROACHING]['distance_percent']
+    _BREAKEVEN_PROFIT = ALERT_THRESHOLDS[AlertType.BREAKEVEN_TRIGGER]['profit_percent']
+    _PARTIAL_CLOSE_PROFIT = ALERT_THRESHOLDS[AlertType.PARTIAL_CLOSE]['profit_percent']
+    
+    def __init__(self, telegram_bot: AlphaTelegramBot, time_filter: Optional[TimeFilter] = None):
+        # Keyed by trade_id - a new signal must not replace an open trade
+        # on the same asset
+        self.active_trades: Dict[int, ActiveTrade] = {}
+        self._trade_ids = count(1)
         self.telegram = telegram_bot
         self.monitoring = False
-        self.price_history: Dict[str, List[Tuple[datetime, float]]] = {}
+        self.price_history: Dict[int, Deque[Tuple[datetime, float]]] = {}
         self.performance_callback = None
+        self.time_filter = time_filter
+        # Set by add_trade/stop_monitoring to cut the loop's sleep short
+        self._wakeup = asyncio.Event()
+        # Outgoing Telegram messages, drained by a background sender so the
+        # monitor loop never waits on Telegram latency
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=256)
         
-    def add_trade(self, trade: ActiveTrade) -> Optional[asyncio.Task]:
+    def on_price(self, asset: str, price: float):
+        """Push hook for streamed prices - wakes the loop when an open trade moves"""
+        for trade in self.active_trades.values():
+            if trade.asset == asset and trade.is_open and price != trade.current_price:
+                self._wakeup.set()
+                return
+    
+    def add_trade(self, trade: ActiveTrade):
         """Add new trade to monitor"""
-        self.active_trades.append(trade)
-        self.price_history[trade.asset] = []
+        trade.trade_id = next(self._trade_ids)
+        self.active_trades[trade.trade_id] = trade
+        self.price_history[trade.trade_id] = deque(maxlen=100)
+        self._wakeup.set()
         logger.info(f"📊 Added trade: {trade.asset} {trade.direction} @ {trade.entry_price}")
         
-        return asyncio.create_task(self._send_trade_confirmation(trade))
+        self._send_trade_confirmation(trade)
     
-    async def _send_trade_confirmation(self, trade: ActiveTrade):
-        """Send trade entry confirmation"""
+    def _send_trade_confirmation(self, trade: ActiveTrade):
+        """Queue trade entry confirmation"""
         message = (
             f"✅ <b>TRADE ACTIVE - AUTO MANAGED</b>\n\n"
             f"Asset: {trade.asset}\n"
@@ -136,34 +238,84 @@ class TradeMonitor:
             f"• Trail stop after TP1\n"
             f"• Auto-close after {trade.max_hold_minutes}min"
         )
-        await self.telegram.send_status(message)
+        self._queue_message(message, critical=True)
     
-    async def start_monitoring(self, data_fetcher):
-        """Start continuous monitoring loop"""
+    async def start_monitoring(self, data_fetcher, batch_fetcher=None):
+        """Start continuous monitoring loop
+        
+        data_fetcher(asset) -> price; batch_fetcher(assets) -> {asset: price},
+        when given, prices every open trade in a single call per tick
+        """
         self.monitoring = True
         
+        # The sender is owned here: it is always cancelled and awaited, so it
+        # cannot outlive the monitor and its failures surface here
+        sender = asyncio.create_task(self._sender_loop())
+        try:
+            await self._monitor_loop(data_fetcher, batch_fetcher)
+        finally:
+            await self._flush_outbox()
+            sender.cancel()
+            try:
+                await sender
+            except asyncio.CancelledError:
+                pass
+    
+    async def _fetch_prices(self, open_trades: List[ActiveTrade], data_fetcher, batch_fetcher) -> List:
+        """Prices (or exceptions) aligned with open_trades"""
+        # Trades on the same asset share one price request
+        assets = list(dict.fromkeys(t.asset for t in open_trades))
+        if batch_fetcher is not None:
+            try:
+                price_map = await asyncio.wait_for(batch_fetcher(assets), timeout=10.0)
+                return [price_map.get(t.asset, 0) for t in open_trades]
+            except Exception as e:
+                logger.error(f"Batch price fetch failed, falling back per asset: {e}")
+        
+        # Fetch all prices concurrently (one per asset), each with its own timeout
+        fetched = await asyncio.gather(
+            *(asyncio.wait_for(data_fetcher(asset), timeout=10.0) for asset in assets),
+            return_exceptions=True
+        )
+        price_map = dict(zip(assets, fetched))
+        return [price_map[t.asset] for t in open_trades]
+    
+    async def _monitor_loop(self, data_fetcher, batch_fetcher=None):
+        """Price, evaluate and notify every open trade until stopped"""
+        # Monotonic deadline of the next heartbeat tick - keeps a fixed cadence
+        # however long the tick's own work takes
+        deadline: Optional[float] = None
+        
         while self.monitoring:
             try:
                 if not self.active_trades:
-                    await asyncio.sleep(5)
+                    deadline = None
+                    # Idle through the whole gap between golden-hour sessions
+                    idle = 60
+                    if self.time_filter:
+                        rec = self.time_filter.get_sleep_recommendation()
+                        if rec['action'] == 'sleep':
+                            idle = min(rec['sleep_seconds'], 3600)
+                    await self._sleep(idle)
                     continue
                 
+                # Open trades this tick - closes are applied after the loop, so no copy is needed
+                open_trades = [t for t in self.active_trades.values() if t.is_open]
+                
+                prices = await self._fetch_prices(open_trades, data_fetcher, batch_fetcher)
+                
+                pending_alerts = []
+                pending_closes = []
+                # One clock read per tick, shared by history and time-exit checks
+                now = datetime.now(timezone.utc)
+                
                 # Update all trade prices
-                for trade in self.active_trades.copy():
-                    if trade.status != "open":
-                        continue
-                    
-                    # Fetch current price with timeout
-                    try:
-                        current_price = await asyncio.wait_for(
-                            data_fetcher(trade.asset),
-                            timeout=10.0
-                        )
-                    except asyncio.TimeoutError:
+                for trade, current_price in zip(open_trades, prices):
+                    if isinstance(current_price, asyncio.TimeoutError):
                         logger.error(f"Price fetch timeout for {trade.asset}")
                         continue
-                    except Exception as e:
-                        logger.error(f"Price fetch error for {trade.asset}: {e}")
+                    if isinstance(current_price, Exception):
+                        logger.error(f"Price fetch error for {trade.asset}: {current_price}")
                         continue
                     
                     if current_price == 0:
@@ -171,47 +323,96 @@ class TradeMonitor:
                     
                     trade.update_price(current_price)
                     
-                    # Store price history
-                    self.price_history[trade.asset].append((datetime.now(timezone.utc), current_price))
-                    
-                    # Keep only last 100 prices
-                    if len(self.price_history[trade.asset]) > 100:
-                        self.price_history[trade.asset] = self.price_history[trade.asset][-100:]
+                    # Store price history (bounded to the last 100 prices)
+                    self.price_history[trade.trade_id].append((now, current_price))
                     
-                    # Check all alert conditions
-                    await self._check_alerts(trade)
+                    # Exits, alerts and auto-management in one pass
+                    alerts, closing = self._tick(trade, now)
                     
-                    # Check time-based exit
-                    await self._check_time_exit(trade)
-                    
-                    # Check if trade hit SL/TP
-                    await self._check_trade_status(trade)
-                    
-                    # Auto-management
-                    if trade.auto_manage:
-                        await self._auto_manage(trade)
+                    pending_alerts.extend((trade, alert_type, data) for alert_type, data in alerts)
+                    if closing is not None:
+                        pending_closes.append((trade, *closing))
                 
-                # Clean up closed trades
-                self.active_trades = [t for t in self.active_trades if t.status == "open"]
+                # Notify: alerts are queued first, then closes in order
+                for trade, alert_type, data in pending_alerts:
+                    self._send_alert(trade, alert_type, data)
+                for trade, reason, result in pending_closes:
+                    await self._close_trade(trade, reason, result)
                 
-                await asyncio.sleep(5)
+                # Pushes arriving during the short pause are kept and wake the next sleep
+                await asyncio.sleep(self.PUSH_MIN_INTERVAL)
+                
+                now_mono = time.monotonic()
+                if deadline is None or now_mono >= deadline:
+                    deadline = (deadline or now_mono) + self.HEARTBEAT_SECONDS
+                    if deadline <= now_mono:
+                        # Chronically late - restart the cadence rather than burst to catch up
+                        logger.warning("Monitor tick overran heartbeat, resetting schedule")
+                        deadline = now_mono + self.HEARTBEAT_SECONDS
+                await self._sleep(deadline - now_mono)
                 
             except Exception as e:
                 logger.error(f"Monitor error: {e}")
                 await asyncio.sleep(10)
     
-    async def _check_time_exit(self, trade: ActiveTrade):
-        """Check and handle time-based exit"""
-        hold_time = trade.get_hold_time_minutes()
+    async def _sender_loop(self):
+        """Deliver queued Telegram messages, sending each burst concurrently"""
+        while True:
+            batch = [await self._outbox.get()]
+            while len(batch) < self.SEND_BATCH_SIZE and not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            
+            results = await asyncio.gather(
+                *(self.telegram.send_status(message) for message in batch),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Alert send error: {result}")
+                self._outbox.task_done()
+    
+    async def _flush_outbox(self):
+        """Give queued messages a bounded chance to go out before shutdown"""
+        try:
+            await asyncio.wait_for(self._outbox.join(), timeout=10.0)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {self._outbox.qsize()} unsent alerts on shutdown")
+    
+    def _queue_message(self, message: str, critical: bool = False):
+        """Hand a message to the sender; when backed up, only critical ones get in"""
+        try:
+            self._outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            if not critical:
+                logger.warning("Telegram outbox full - dropping alert")
+                return
+            # Make room by discarding the oldest queued message
+            self._outbox.get_nowait()
+            self._outbox.task_done()
+            self._outbox.put_nowait(message)
+            logger.warning("Telegram outbox full - dropped oldest message for a close notice")
+    
+    async def _sleep(self, timeout: float):
+        """Sleep up to timeout seconds, returning early on wakeup"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+    
+    def _check_time_exit(self, trade: ActiveTrade, now: datetime) -> Tuple[List[AlertEvent], Optional[CloseRequest]]:
+        """Check time-based exit - returns alerts to send and an optional close"""
+        alerts = []
+        hold_time = trade.get_hold_time_minutes(now)
         
         # Warning at 50 minutes (10 min before expiry)
         if hold_time > 50 and not trade.time_exit_triggered:
             if AlertType.TIME_EXPIRING not in trade.alerts_sent:
-                await self._send_alert(trade, AlertType.TIME_EXPIRING, {
+                alerts.append((AlertType.TIME_EXPIRING, {
                     'hold_time': f"{hold_time:.0f}m",
                     'time_remaining': f"{trade.max_hold_minutes - hold_time:.0f}m"
-                })
-                trade.alerts_sent.append(AlertType.TIME_EXPIRING)
+                }))
+                trade.alerts_sent |= AlertType.TIME_EXPIRING
         
         # Action at 60 minutes
         if hold_time > trade.max_hold_minutes and not trade.time_exit_triggered:
@@ -228,122 +429,148 @@ class TradeMonitor:
                 trade.trail_stop_active = True
                 trade.trail_stop_price = new_stop
                 
-                await self._send_alert(trade, AlertType.TIME_EXPIRING, {
+                alerts.append((AlertType.TIME_EXPIRING, {
                     'hold_time': f"{hold_time:.0f}m",
                     'action': 'Tightened stop to +0.3%',
                     'new_sl': new_stop,
                     'pnl': f"{trade.pnl_percent:.2f}%"
-                })
+                }))
                 
                 logger.info(f"Time exit: Tightened stop for {trade.asset} to {new_stop:,.2f}")
                 
             # If small profit or loss, close immediately
             else:
-                trade.status = "time_exit"
+                trade.mark_closed("time_exit")
                 result = "breakeven" if trade.pnl_percent >= 0 else "small_loss"
-                await self._close_trade(trade, "TIME EXPIRED", result)
+                return alerts, ("TIME EXPIRED", result)
+        
+        return alerts, None
     
-    async def _auto_manage(self, trade: ActiveTrade):
-        """Auto-manage trade based on profit levels"""
+    def _auto_manage(self, trade: ActiveTrade) -> List[AlertEvent]:
+        """Auto-manage trade based on profit levels - returns alerts to send"""
+        alerts = []
+        
+        # Late stage: BE, partial close and trail all done - only the trail moves
+        if trade.trail_stop_active and trade.be_triggered and trade.tp1_triggered:
+            self._update_trail(trade)
+            return alerts
         
         # 1. Move to breakeven at +1%
-        if not trade.be_triggered and trade.pnl_percent >= 1.0:
+        if not trade.be_triggered and trade.pnl_percent >= self._BREAKEVEN_PROFIT:
             trade.stop_loss = trade.entry_price
             trade.be_triggered = True
-            await self._send_alert(trade, AlertType.BREAKEVEN_TRIGGER, {
+            alerts.append((AlertType.BREAKEVEN_TRIGGER, {
                 'new_sl': trade.entry_price,
                 'current_pnl': trade.pnl_percent
-            })
+            }))
             logger.info(f"Auto-moved SL to BE for {trade.asset}")
         
         # 2. Partial close at TP1 (+2%)
-        if not trade.tp1_triggered and trade.pnl_percent >= 2.0:
+        if not trade.tp1_triggered and trade.pnl_percent >= self._PARTIAL_CLOSE_PROFIT:
             trade.tp1_triggered = True
-            await self._send_alert(trade, AlertType.PARTIAL_CLOSE, {
+            alerts.append((AlertType.PARTIAL_CLOSE, {
                 'close_percent': 50,
                 'keep_running': 50,
                 'current_pnl': trade.pnl_percent
-            })
+            }))
             logger.info(f"Auto-partial close triggered for {trade.asset}")
         
         # 3. Activate trailing stop after TP1
         if trade.tp1_triggered and not trade.trail_stop_active:
             if trade.pnl_percent >= 3.0:
                 trade.trail_stop_active = True
-                trade.trail_stop_price = trade.current_price * 0.99 if trade.direction == 'long' else trade.current_price * 1.01
-                await self._send_alert(trade, AlertType.TRAIL_STOP_TRIGGER, {
+                trade.trail_stop_price = trade.current_price * trade._trail_mult
+                alerts.append((AlertType.TRAIL_STOP_TRIGGER, {
                     'trail_price': trade.trail_stop_price
-                })
+                }))
                 logger.info(f"Auto-trail stop activated for {trade.asset}")
         
         # 4. Update trailing stop
         if trade.trail_stop_active:
-            new_trail = trade.current_price * 0.99 if trade.direction == 'long' else trade.current_price * 1.01
-            
-            if trade.direction == 'long' and new_trail > trade.trail_stop_price:
-                trade.trail_stop_price = new_trail
-                trade.stop_loss = new_trail
-                logger.info(f"Trail stop updated for {trade.asset}: {new_trail:,.2f}")
-            elif trade.direction == 'short' and new_trail < trade.trail_stop_price:
-                trade.trail_stop_price = new_trail
-                trade.stop_loss = new_trail
-                logger.info(f"Trail stop updated for {trade.asset}: {new_trail:,.2f}")
+            self._update_trail(trade)
+        
+        return alerts
     
-    async def _check_alerts(self, trade: ActiveTrade):
-        """Check and send alerts"""
-        # Check SL approaching
-        if trade.direction == 'long':
-            distance_to_sl = ((trade.current_price - trade.stop_loss) / trade.entry_price) * 100
-        else:
-            distance_to_sl = ((trade.stop_loss - trade.current_price) / trade.entry_price) * 100
-        
-        if distance_to_sl < 0.5 and AlertType.SL_APPROACHING not in trade.alerts_sent:
-            await self._send_alert(trade, AlertType.SL_APPROACHING, {
+    def _update_trail(self, trade: ActiveTrade):
+        """Move the trailing stop with price, never loosening it"""
+        new_trail = trade.current_price * trade._trail_mult
+        
+        # Only ever tighten: up for longs, down for shorts
+        if trade._sign * (new_trail - trade.trail_stop_price) > 0:
+            trade.trail_stop_price = new_trail
+            trade.stop_loss = new_trail
+            logger.info(f"Trail stop updated for {trade.asset}: {new_trail:,.2f}")
+    
+    def _check_proximity(self, trade: ActiveTrade, distance_to_sl: float, alerts: List[AlertEvent]):
+        """Append SL/TP1-approaching alerts that have not fired yet"""
+        price = trade.current_price
+        
+        # SL approaching
+        if distance_to_sl < self._SL_ALERT_DISTANCE and AlertType.SL_APPROACHING not in trade.alerts_sent:
+            alerts.append((AlertType.SL_APPROACHING, {
                 'distance': f"{distance_to_sl:.2f}%",
-                'current': trade.current_price
-            })
-            trade.alerts_sent.append(AlertType.SL_APPROACHING)
+                'current': price
+            }))
+            trade.alerts_sent |= AlertType.SL_APPROACHING
         
-        # Check TP1 approaching
+        # TP1 approaching
         if not trade.tp1_triggered:
-            if trade.direction == 'long':
-                distance_to_tp1 = ((trade.tp1 - trade.current_price) / trade.entry_price) * 100
-            else:
-                distance_to_tp1 = ((trade.current_price - trade.tp1) / trade.entry_price) * 100
-            
-            if distance_to_tp1 < 0.3 and AlertType.TP1_APPROACHING not in trade.alerts_sent:
-                await self._send_alert(trade, AlertType.TP1_APPROACHING, {
+            distance_to_tp1 = trade._sign * (trade.tp1 - price) * trade._inv_entry * 100.0
+            if distance_to_tp1 < self._TP1_ALERT_DISTANCE and AlertType.TP1_APPROACHING not in trade.alerts_sent:
+                alerts.append((AlertType.TP1_APPROACHING, {
                     'distance': f"{distance_to_tp1:.2f}%",
-                    'current': trade.current_price
-                })
-                trade.alerts_sent.append(AlertType.TP1_APPROACHING)
+                    'current': price
+                }))
+                trade.alerts_sent |= AlertType.TP1_APPROACHING
     
-    async def _check_trade_status(self, trade: ActiveTrade):
-        """Check if SL or TP hit"""
+    def _tick(self, trade: ActiveTrade, now: datetime) -> Tuple[List[AlertEvent], Optional[CloseRequest]]:
+        """Evaluate a freshly priced trade - returns alerts to send and an optional close"""
+        # Signed so one comparison covers both long and short
+        sign = trade._sign
+        price = trade.current_price
         
-        if trade.direction == 'long':
-            if trade.current_price <= trade.stop_loss:
-                trade.status = "sl_hit"
-                await self._close_trade(trade, "STOP LOSS", "loss")
-                
-            elif trade.current_price >= trade.tp2:
-                trade.status = "tp2_hit"
-                await self._close_trade(trade, "TP2 HIT - FULL TARGET", "win")
-                
-        else:  # short
-            if trade.current_price >= trade.stop_loss:
-                trade.status = "sl_hit"
-                await self._close_trade(trade, "STOP LOSS", "loss")
-                
-            elif trade.current_price <= trade.tp2:
-                trade.status = "tp2_hit"
-                await self._close_trade(trade, "TP2 HIT - FULL TARGET", "win")
+        # SL / TP2 hit - nothing else matters for this trade
+        distance_to_sl = sign * (price - trade.stop_loss) * trade._inv_entry * 100.0
+        if distance_to_sl <= 0:
+            trade.mark_closed("sl_hit")
+            return [], ("STOP LOSS", "loss")
+        
+        if sign * (price - trade.tp2) >= 0:
+            trade.mark_closed("tp2_hit")
+            return [], ("TP2 HIT - FULL TARGET", "win")
+        
+        alerts = []
+        
+        # Proximity alerts, skipped entirely once none can still fire -
+        # TP1-approaching is moot after TP1 itself has triggered
+        settled = trade.alerts_sent & _PROXIMITY_ALERTS
+        if trade.tp1_triggered:
+            settled |= AlertType.TP1_APPROACHING
+        if settled != _PROXIMITY_ALERTS:
+            self._check_proximity(trade, distance_to_sl, alerts)
+        
+        # Time-based exit
+        time_alerts, closing = self._check_time_exit(trade, now)
+        alerts.extend(time_alerts)
+        if closing is not None:
+            return alerts, closing
+        
+        # Auto-management
+        if trade.auto_manage:
+            alerts.extend(self._auto_manage(trade))
+        
+        return alerts, None
     
     async def _close_trade(self, trade: ActiveTrade, reason: str, result: str):
         """Close trade and notify"""
+        # Stop monitoring it; other trades on the same asset are unaffected
+        self.active_trades.pop(trade.trade_id, None)
+        self.price_history.pop(trade.trade_id, None)
+        
         emoji = "✅" if result == "win" else "❌" if result == "loss" else "⚠️"
         
-        duration = datetime.now(timezone.utc) - trade.entry_time
+        closed_at = datetime.now(timezone.utc)
+        duration = closed_at - trade.entry_time
         hours, remainder = divmod(duration.seconds, 3600)
         minutes, _ = divmod(remainder, 60)
         duration_str = f"{hours}h {minutes}m"
@@ -359,10 +586,10 @@ class TradeMonitor:
             f"{pnl_emoji} <b>P&L: {trade.pnl_percent:+.2f}%</b>\n"
             f"Duration: {duration_str}\n"
             f"Regime: {trade.regime}\n\n"
-            f"<i>{datetime.now(timezone.utc).strftime('%H:%M:%S')} UTC</i>"
+            f"<i>{closed_at.strftime('%H:%M:%S')} UTC</i>"
         )
         
-        await self.telegram.send_status(message)
+        self._queue_message(message, critical=True)
         logger.info(f"Trade closed: {trade.asset} | P&L: {trade.pnl_percent:.2f}%")
         
         # NEW: Record for adaptive optimizer
@@ -390,38 +617,22 @@ class TradeMonitor:
         if self.performance_callback:
             await self.performance_callback(result, trade.pnl_percent, trade.asset)
     
-    async def _send_alert(self, trade: ActiveTrade, alert_type: AlertType, data: dict):
-        """Send alert to Telegram"""
-        emoji_map = {
-            AlertType.SL_APPROACHING: '🚨',
-            AlertType.TP1_APPROACHING: '🎯',
-            AlertType.BREAKEVEN_TRIGGER: '✅',
-            AlertType.TRAIL_STOP_TRIGGER: '📈',
-            AlertType.PARTIAL_CLOSE: '🔒',
-            AlertType.TIME_EXPIRING: '⏰',
-            AlertType.TIME_EXPIRED: '⏰'
-        }
-        
-        emoji = emoji_map.get(alert_type, '⚠️')
-        base_message = self.ALERT_THRESHOLDS.get(alert_type, {}).get('message', 'Alert')
-        
-        message = (
-            f"{emoji} <b>{alert_type.value.upper().replace('_', ' ')}</b>\n\n"
-            f"Asset: {trade.asset}\n"
-            f"Direction: {trade.direction.upper()}\n"
-            f"Entry: {trade.entry_price:,.2f}\n"
-            f"Current: {trade.current_price:,.2f}\n"
-            f"P&L: {trade.pnl_percent:+.2f}%\n\n"
-            f"<b>{base_message}</b>\n"
-        )
-        
-        for key, value in data.items():
-            formatted_key = key.replace('_', ' ').title()
-            message += f"\n{formatted_key}: {value}"
+    def _send_alert(self, trade: ActiveTrade, alert_type: AlertType, data: dict):
+        """Queue alert for Telegram"""
+        message = self._ALERT_TEMPLATES[alert_type].format_map({
+            'asset': trade.asset,
+            'direction': trade.direction.upper(),
+            'entry': trade.entry_price,
+            'current': trade.current_price,
+            'pnl': trade.pnl_percent,
+        })
+        if data:
+            message += ''.join(f"\n{_field_label(key)}: {value}" for key, value in data.items())
         
-        await self.telegram.send_status(message)
+        self._queue_message(message)
     
     def stop_monitoring(self):
         """Stop monitoring loop"""
         self.monitoring = False
+        self._wakeup.set()
         logger.info("Trade monitoring stopped")
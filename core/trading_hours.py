@@ -4,12 +4,17 @@ Best times to trade and times to avoid
 Indian Time (IST) + Market Analysis
 """
 
+import functools
+import html
+from array import array
+from bisect import bisect_left
 from typing import Dict, List, Tuple
 from datetime import datetime, time
-import pytz
+from zoneinfo import ZoneInfo
 
 # Indian Standard Time
-IST = pytz.timezone('Asia/Kolkata')
+IST = ZoneInfo('Asia/Kolkata')
+_IST_OFFSET_MINUTES = 330  # UTC+5:30, fixed all year
 
 # UTC times (convert to IST: UTC+5:30)
 TRADING_SESSIONS = {
@@ -122,6 +127,113 @@ TRADING_SESSIONS = {
     }
 }
 
+@functools.lru_cache(maxsize=64)
+def _parse_utc_time(time_str: str) -> float:
+    """Parse UTC time string to float hours"""
+    if ' ' in time_str:
+        time_str = time_str.split(' ')[1]
+    parsed = time.fromisoformat(time_str)
+    return parsed.hour + parsed.minute / 60
+
+@functools.lru_cache(maxsize=64)
+def _utc_to_ist(utc_time: str) -> str:
+    """Convert UTC time to IST"""
+    parsed = time.fromisoformat(utc_time)
+    hour, minute = parsed.hour, parsed.minute
+    ist_hour = (hour + 5) % 24
+    ist_minute = (minute + 30) % 60
+    if minute + 30 >= 60:
+        ist_hour = (ist_hour + 1) % 24
+    
+    return f"{ist_hour:02d}:{ist_minute:02d}"
+
+def _session_payloads(quality: str, session: Dict) -> Tuple[Dict, Dict]:
+    """is_best_time results for a session: (no asset given, asset given)"""
+    if quality == 'best':
+        info = {
+            'session': session['name'],
+            'quality': 'excellent',
+            'priority': session['priority']
+        }
+        return info, {
+            **info,
+            'expected_move': session['expected_moves'],
+            'description': session['description']
+        }
+    if quality == 'moderate':
+        info = {
+            'session': session['name'],
+            'quality': 'moderate',
+            'priority': session['priority'],
+            'expected_move': session['expected_moves']
+        }
+        return info, info
+    # avoid - next_best depends on the clock and is added per call
+    info = {
+        'reason': session['description'],
+        'quality': 'avoid',
+        'explanation': session['reason']
+    }
+    return info, info
+
+def _build_session_index() -> List[Tuple]:
+    """Flatten TRADING_SESSIONS into
+    (start, end, quality, assets, info, asset_info) rows.
+
+    Rows keep the precedence is_best_time has always used: best sessions
+    in table order, then moderate, then avoid windows.  Only best
+    sessions are asset-restricted; assets is None for the rest.
+    Weekday-prefixed entries ('Friday 21:00') keep their clock time only,
+    as before.
+    """
+    rows = []
+    for quality in ('best', 'moderate', 'avoid'):
+        for session in TRADING_SESSIONS[quality].values():
+            if 'utc_start' not in session:
+                continue
+            rows.append((
+                _parse_utc_time(session['utc_start']),
+                _parse_utc_time(session['utc_end']),
+                quality,
+                frozenset(session['assets']) if quality == 'best' else None,
+                *_session_payloads(quality, session),
+            ))
+    return rows
+
+def _build_session_slots(rows):
+    """Split the day at every session boundary.
+
+    Returns the sorted boundaries plus, for each boundary point and each
+    open gap between boundaries, the rows covering it in precedence order.
+    Slot 2*i+1 is boundary i itself, slot 2*i is the gap just before it.
+    """
+    bounds = sorted({t for row in rows for t in row[:2]})
+    probes = []
+    for i, b in enumerate(bounds):
+        prev = bounds[i - 1] if i else -1.0
+        probes.append((prev + b) / 2)
+        probes.append(b)
+    probes.append(bounds[-1] + 1.0 if bounds else 0.0)
+    slots = [
+        tuple(row for row in rows if row[0] <= t <= row[1])
+        for t in probes
+    ]
+    return array('d', bounds), slots
+
+# Built once at import - is_best_time never parses a time string
+_SESSION_INDEX = _build_session_index()
+_SESSION_BOUNDS, _SESSION_SLOTS = _build_session_slots(_SESSION_INDEX)
+
+def _sessions_at(hours: float) -> Tuple:
+    """Rows covering a UTC float hour, best-first"""
+    i = bisect_left(_SESSION_BOUNDS, hours)
+    if i < len(_SESSION_BOUNDS) and _SESSION_BOUNDS[i] == hours:
+        return _SESSION_SLOTS[2 * i + 1]
+    return _SESSION_SLOTS[2 * i]
+
+# Session qualities that allow trading
+TRADEABLE_QUALITIES = frozenset({'excellent', 'moderate'})
+
 # Asset-specific best times
 ASSET_BEST_TIMES = {
     'BTC': {
@@ -188,7 +300,11 @@ class TradingHoursManager:
     """Manages trading hours and filters"""
     
     def __init__(self):
-        self.ist = pytz.timezone('Asia/Kolkata')
+        self.ist = IST
+        # Pure function of TRADING_SESSIONS - build once
+        self._daily_schedule = self._compute_daily_schedule()
+        # asset -> (minute key, result); sessions only change on whole minutes
+        self._best_time_cache: Dict[str, Tuple[int, Tuple[bool, Dict]]] = {}
         
     def get_current_ist_time(self) -> datetime:
         """Get current IST time"""
@@ -198,71 +314,41 @@ class TradingHoursManager:
         """Check if current time is best for trading"""
         
         now = self.get_current_ist_time()
-        current_time = now.time()
-        current_weekday = now.strftime('%A')
+        minute_key = now.toordinal() * 1440 + now.hour * 60 + now.minute
         
-        # Convert current time to UTC for comparison
-        current_utc = now.astimezone(pytz.UTC)
-        current_hour = current_utc.hour
-        current_minute = current_utc.minute
-        current_time_float = current_hour + current_minute / 60
+        cached = self._best_time_cache.get(asset)
+        if cached is None or cached[0] != minute_key:
+            cached = (minute_key, self._evaluate_best_time(now, asset))
+            self._best_time_cache[asset] = cached
+        
+        is_good, info = cached[1]
+        return is_good, dict(info)
+    
+    def _evaluate_best_time(self, now: datetime, asset: str = None) -> Tuple[bool, Dict]:
+        """Uncached is_best_time for an IST datetime"""
         
         # Check if weekend
-        if current_weekday in ['Saturday', 'Sunday']:
+        if now.weekday() >= 5:  # Saturday/Sunday
             return False, {
                 'reason': 'Weekend - low institutional activity',
                 'quality': 'avoid',
                 'next_best': self._get_next_best_time(now)
             }
         
-        # Check best sessions
-        for session_type, sessions in TRADING_SESSIONS['best'].items():
-            start = self._parse_utc_time(sessions['utc_start'])
-            end = self._parse_utc_time(sessions['utc_end'])
-            
-            if start <= current_time_float <= end:
-                # Check asset specific
-                if asset and asset in sessions['assets']:
-                    return True, {
-                        'session': sessions['name'],
-                        'quality': 'excellent',
-                        'priority': sessions['priority'],
-                        'expected_move': sessions['expected_moves'],
-                        'description': sessions['description']
-                    }
-                elif not asset:
-                    return True, {
-                        'session': sessions['name'],
-                        'quality': 'excellent',
-                        'priority': sessions['priority']
-                    }
-        
-        # Check moderate sessions
-        for session_type, sessions in TRADING_SESSIONS['moderate'].items():
-            start = self._parse_utc_time(sessions['utc_start'])
-            end = self._parse_utc_time(sessions['utc_end'])
-            
-            if start <= current_time_float <= end:
-                return True, {
-                    'session': sessions['name'],
-                    'quality': 'moderate',
-                    'priority': sessions['priority'],
-                    'expected_move': sessions['expected_moves']
-                }
+        # IST has no DST - shift the wall clock to UTC instead of astimezone()
+        current_hour, current_minute = divmod(
+            (now.hour * 60 + now.minute - _IST_OFFSET_MINUTES) % 1440, 60
+        )
+        current_time_float = current_hour + current_minute / 60
         
-        # Check avoid times
-        for avoid_type, avoid_data in TRADING_SESSIONS['avoid'].items():
-            if 'utc_start' in avoid_data:
-                start = self._parse_utc_time(avoid_data['utc_start'])
-                end = self._parse_utc_time(avoid_data['utc_end'])
-                
-                if start <= current_time_float <= end:
-                    return False, {
-                        'reason': avoid_data['description'],
-                        'quality': 'avoid',
-                        'explanation': avoid_data['reason'],
-                        'next_best': self._get_next_best_time(now)
-                    }
+        for _, _, quality, assets, info, asset_info in _sessions_at(current_time_float):
+            if quality == 'avoid':
+                return False, {**info, 'next_best': self._get_next_best_time(now)}
+            if not asset:
+                return True, info
+            # Best sessions only count for the assets they list
+            if assets is None or asset in assets:
+                return True, asset_info
         
         # Default: moderate
         return True, {
@@ -271,12 +357,7 @@ class TradingHoursManager:
             'priority': 7
         }
     
-    def _parse_utc_time(self, time_str: str) -> float:
-        """Parse UTC time string to float hours"""
-        if ' ' in time_str:
-            time_str = time_str.split(' ')[1]
-        hour, minute = map(int, time_str.split(':'))
-        return hour + minute / 60
+    _parse_utc_time = staticmethod(_parse_utc_time)
     
     def _get_next_best_time(self, current: datetime) -> str:
         """Calculate next best trading time"""
@@ -295,7 +376,6 @@ class TradingHoursManager:
         
         asset_times = ASSET_BEST_TIMES.get(asset, ASSET_BEST_TIMES['BTC'])
         
-        now = self.get_current_ist_time()
         is_good, time_info = self.is_best_time(asset)
         
         return {
@@ -303,11 +383,15 @@ class TradingHoursManager:
             'current_quality': time_info.get('quality', 'unknown'),
             'best_sessions': asset_times['primary'],
             'avoid_sessions': asset_times['avoid'],
-            'should_trade_now': is_good and time_info.get('quality') in ['excellent', 'moderate']
+            'should_trade_now': is_good and time_info.get('quality') in TRADEABLE_QUALITIES
         }
     
     def get_daily_schedule(self) -> List[Dict]:
         """Get full daily schedule in IST"""
+        return self._daily_schedule
+    
+    def _compute_daily_schedule(self) -> List[Dict]:
+        """Build the IST schedule from TRADING_SESSIONS"""
         
         schedule = []
         
@@ -337,15 +421,7 @@ class TradingHoursManager:
         
         return sorted(schedule, key=lambda x: x['time'])
     
-    def _utc_to_ist(self, utc_time: str) -> str:
-        """Convert UTC time to IST"""
-        hour, minute = map(int, utc_time.split(':'))
-        ist_hour = (hour + 5) % 24
-        ist_minute = (minute + 30) % 60
-        if minute + 30 >= 60:
-            ist_hour = (ist_hour + 1) % 24
-        
-        return f"{ist_hour:02d}:{ist_minute:02d}"
+    _utc_to_ist = staticmethod(_utc_to_ist)
     
     def is_news_event_time(self) -> Tuple[bool, str]:
         """Check if near major news event"""
@@ -356,7 +432,6 @@ class TradingHoursManager:
     def get_sleep_duration(self) -> int:
         """Get seconds to sleep until next best time"""
         
-        now = self.get_current_ist_time()
         is_good, info = self.is_best_time()
         
         if is_good and info.get('quality') == 'excellent':
@@ -371,8 +446,10 @@ class TradingHoursManager:
 # Global instance
 trading_hours = TradingHoursManager()
 
-# Quick reference for manual trading
-QUICK_REFERENCE = """
+# Quick reference for manual trading - built on first use, not at import
+@functools.cache
+def get_quick_reference() -> str:
+    return """
 ╔════════════════════════════════════════════════════════════╗
 ║           ⏰ BEST TRADING TIMES (IST)                      ║
 ╠════════════════════════════════════════════════════════════╣
@@ -399,3 +476,26 @@ QUICK_REFERENCE = """
 ║  └─ Major exchange news → Wait 2 hours                     ║
 ╚════════════════════════════════════════════════════════════╝
 """
+
+@functools.cache
+def get_quick_reference_bytes() -> bytes:
+    """UTF-8 form for transports that accept raw bytes"""
+    return get_quick_reference().encode('utf-8')
+
+@functools.cache
+def get_quick_reference_html() -> str:
+    """Escaped <pre> form for Telegram HTML"""
+    return f"<pre>{html.escape(get_quick_reference().strip())}</pre>"
+
+_LAZY_CONSTANTS = {
+    'QUICK_REFERENCE': get_quick_reference,
+    'QUICK_REFERENCE_BYTES': get_quick_reference_bytes,
+    'QUICK_REFERENCE_HTML': get_quick_reference_html,
+}
+
+def __getattr__(name: str):
+    """PEP 562 - keep the old constant names importable"""
+    factory = _LAZY_CONSTANTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
@@ -3,17 +3,63 @@ WebSocket Manager - FIXED with Thread-Safe Operations
 """
 
 import asyncio
-import json
 import logging
+import numpy as np
 import websockets
 from typing import Dict, Callable
-from datetime import datetime, timezone
 from collections import deque
+from itertools import islice
+
+from core._njit import njit, HAVE_NUMBA
+
+try:
+    import orjson as _json  # several times faster on Binance payloads
+except ImportError:
+    import json as _json
+
+def _ndarray_default(obj):
+    """JSON fallback for numpy arrays the encoder can't take natively"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+if _json.__name__ == 'orjson':
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, default=_ndarray_default, option=_json.OPT_SERIALIZE_NUMPY)
+else:
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, default=_ndarray_default).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _compute_ob_features(bids, asks):
+    """(mid, spread_pct, ofi, bid_pressure, ask_pressure, avg_bid, avg_ask)
+    for non-empty (n, 2) float64 price/qty arrays"""
+    best_bid = bids[0, 0]
+    best_ask = asks[0, 0]
+    mid_price = (best_bid + best_ask) / 2
+    
+    bid_vol = bids[:, 1].sum()
+    ask_vol = asks[:, 1].sum()
+    total_vol = bid_vol + ask_vol
+    ofi = 0.0 if total_vol == 0 else (bid_vol - ask_vol) / total_vol
+    
+    return (
+        mid_price,
+        (best_ask - best_bid) / mid_price * 100,
+        ofi,
+        (bids[:, 0] * bids[:, 1]).sum(),
+        (asks[:, 0] * asks[:, 1]).sum(),
+        bid_vol / bids.shape[0],
+        ask_vol / asks.shape[0],
+    )
+
+if HAVE_NUMBA:
+    # Absorb the first-call compile at import, not on the first live book
+    _compute_ob_features(np.ones((10, 2)), np.ones((10, 2)))
+
 class WebSocketManager:
-    BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
     BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream?streams="
     
     def __init__(self):
@@ -24,7 +70,7 @@ class WebSocketManager:
         self.reconnect_delay = 3
         self.connected = False
         self.message_count = 0
-        self.last_cleanup = datetime.now(timezone.utc)
+        self._stream_meta: Dict[str, tuple] = {}
         
     async def start(self, assets_config: Dict):
         """Start WebSocket - optimized for fewer assets"""
@@ -46,14 +92,20 @@ class WebSocketManager:
             logger.warning("No WebSocket streams configured")
             return
         
-        # Build URL
-        if len(streams) == 1:
-            url = f"{self.BINANCE_WS_URL}/{streams[0]}"
-        else:
-            streams_param = "/".join(streams)
-            url = f"{self.BINANCE_STREAM_URL}{streams_param}"
+        # stream -> (symbol, handler), resolved once instead of per message
+        self._stream_meta = {
+            s: (
+                s.split('@', 1)[0].upper(),
+                self._handle_trade if '@trade' in s else self._handle_orderbook,
+            )
+            for s in streams
+        }
         
-        logger.info(f"🔌 Connecting: {len(enabled_assets)} assets, {len(streams)} streams")
+        # Always the combined endpoint: every frame is {'stream', 'data'}
+        streams_param = "/".join(streams)
+        url = f"{self.BINANCE_STREAM_URL}{streams_param}"
+        
+        logger.info("🔌 Connecting: %d assets, %d streams", len(enabled_assets), len(streams))
         
         while self.running:
             try:
@@ -73,188 +125,162 @@ class WebSocketManager:
                         
                         self.message_count += 1
                         
-                        # Periodic cleanup every 1000 messages
-                        if self.message_count % 1000 == 0:
-                            self._cleanup_old_data()
-                        
                         try:
-                            data = json.loads(message)
+                            data = _json.loads(message)
                             await self._handle_message(data)
-                        except json.JSONDecodeError:
+                        except _json.JSONDecodeError:
                             continue
                         except Exception as e:
-                            logger.error(f"Handler error: {e}")
+                            logger.error("Handler error: %s", e)
                         
             except websockets.exceptions.InvalidStatusCode as e:
-                logger.error(f"HTTP {e.status_code}, waiting 20s...")
+                logger.error("HTTP %s, waiting 20s...", e.status_code)
                 await asyncio.sleep(20)
                 
             except Exception as e:
                 self.connected = False
-                logger.error(f"WS error: {type(e).__name__}")
+                logger.error("WS error: %s", type(e).__name__)
                 await asyncio.sleep(self.reconnect_delay)
                 self.reconnect_delay = min(self.reconnect_delay * 1.5, 30)
     
-    def _cleanup_old_data(self):
-        """Memory cleanup for Railway Hobby"""
-        now = datetime.now(timezone.utc)
-        if (now - self.last_cleanup).seconds < 60:
-            return
-        
-        for symbol in self.price_data:
-            # deque auto-truncates, no manual cleanup needed
-            pass
-        
-        self.last_cleanup = now
-        logger.debug("Memory cleanup completed")
-    
     async def _handle_message(self, data: Dict):
-        """Process message - optimized"""
+        """Process a combined-stream frame: {'stream': ..., 'data': ...}"""
         try:
-            if 'stream' in data and 'data' in data:
-                stream = data['stream']
-                payload = data['data']
-                symbol = stream.split('@')[0].upper()
-                
-                if 'trade' in stream:
-                    await self._handle_trade(symbol, payload)
-                elif 'depth' in stream:
-                    await self._handle_orderbook(symbol, payload)
-                    
-            elif data.get('e') == 'trade':
-                symbol = data.get('s', '').upper()
-                if symbol:
-                    await self._handle_trade_single(data)
-                    
-            elif data.get('e') == 'depthUpdate':
-                symbol = data.get('s', '').upper()
-                if symbol:
-                    await self._handle_orderbook_single(data)
+            meta = self._stream_meta.get(data.get('stream'))
+            if meta:
+                symbol, handler = meta
+                await handler(symbol, data['data'])
                     
         except Exception as e:
-            logger.error(f"Process error: {e}")
+            logger.error("Process error: %s", e)
     
     async def _handle_trade(self, symbol: str, data: Dict):
         """Process trade - FIX: Use deque for thread safety"""
-        if symbol not in self.price_data:
-            self.price_data[symbol] = {
+        entry = self.price_data.get(symbol)
+        if entry is None:
+            entry = self.price_data[symbol] = {
                 'trades': deque(maxlen=50),  # FIX: Thread-safe deque
                 'last_price': 0, 
                 'last_trade_time': 0
             }
         
+        # Binance trade payloads always carry p/q/T/m; a malformed frame
+        # raises here and is logged by the frame handler
         trade = {
-            'price': float(data.get('p', 0)),
-            'qty': float(data.get('q', 0)),
-            'time': data.get('T', 0),
-            'm': data.get('m', False),
+            'price': float(data['p']),
+            'qty': float(data['q']),
+            'time': data['T'],
+            'm': data['m'],
         }
         
-        self.price_data[symbol]['trades'].append(trade)
-        self.price_data[symbol]['last_price'] = trade['price']
-        self.price_data[symbol]['last_trade_time'] = trade['time']
+        entry['trades'].append(trade)
+        entry['last_price'] = trade['price']
+        entry['last_trade_time'] = trade['time']
         
-        # Callback
-        if symbol in self.callbacks:
-            try:
-                await self.callbacks[symbol]('trade', trade)
-            except:
-                pass
+        await self._dispatch(symbol, 'trade', trade)
     
     async def _handle_orderbook(self, symbol: str, data: Dict):
         """Process orderbook - calculate OFI here"""
         try:
-            if symbol not in self.price_data:
-                self.price_data[symbol] = {
+            entry = self.price_data.get(symbol)
+            if entry is None:
+                entry = self.price_data[symbol] = {
                     'trades': deque(maxlen=50),
                     'last_price': 0
                 }
             
-            raw_bids = data.get('bids', [])
-            raw_asks = data.get('asks', [])
+            raw_bids = data.get('bids', [])[:10]
+            raw_asks = data.get('asks', [])[:10]
             
-            bids = [[float(b[0]), float(b[1])] for b in raw_bids[:10]]
-            asks = [[float(a[0]), float(a[1])] for a in raw_asks[:10]]
-            
-            if not bids or not asks:
+            if not raw_bids or not raw_asks:
                 return
             
-            best_bid = bids[0][0]
-            best_ask = asks[0][0]
-            mid_price = (best_bid + best_ask) / 2
-            
-            # Calculate OFI
-            bid_vol = sum(b[1] for b in bids)
-            ask_vol = sum(a[1] for a in asks)
-            total_vol = bid_vol + ask_vol
+            # Binance sends price/qty strings - numpy parses them in one pass
+            bid_arr = np.array(raw_bids, dtype=np.float64)
+            ask_arr = np.array(raw_asks, dtype=np.float64)
             
-            # FIX: Handle zero volume case better
-            if total_vol == 0:
-                ofi = 0
-            else:
-                ofi = (bid_vol - ask_vol) / total_vol
+            (mid_price, spread_pct, ofi, bid_pressure, ask_pressure,
+             avg_bid, avg_ask) = _compute_ob_features(bid_arr, ask_arr)
             
-            # Calculate walls
-            avg_bid = bid_vol / len(bids) if bids else 0
-            avg_ask = ask_vol / len(asks) if asks else 0
+            # Walls stay in Python - callers expect (price, qty) tuples
+            bid_walls = [tuple(w) for w in bid_arr[bid_arr[:, 1] > avg_bid * 3][:2].tolist()]
+            ask_walls = [tuple(w) for w in ask_arr[ask_arr[:, 1] > avg_ask * 3][:2].tolist()]
             
-            bid_walls = [(b[0], b[1]) for b in bids if b[1] > avg_bid * 3]
-            ask_walls = [(a[0], a[1]) for a in asks if a[1] > avg_ask * 3]
-            
-            self.price_data[symbol]['orderbook'] = {
-                'bids': bids,
-                'asks': asks,
-                'mid_price': mid_price,
-                'spread_pct': (best_ask - best_bid) / mid_price * 100,
-                'ofi_ratio': ofi,
-                'bid_pressure': sum(b[0] * b[1] for b in bids),
-                'ask_pressure': sum(a[0] * a[1] for a in asks),
-                'bid_walls': bid_walls[:2],
-                'ask_walls': ask_walls[:2],
+            # Columns stay as contiguous float64 arrays (SoA), so orjson can
+            # serialize them directly; see get_orderbook_as_lists
+            bid_prices, bid_qtys = bid_arr.T.copy()
+            ask_prices, ask_qtys = ask_arr.T.copy()
+            orderbook = entry['orderbook'] = {
+                'bid_prices': bid_prices,
+                'bid_qtys': bid_qtys,
+                'ask_prices': ask_prices,
+                'ask_qtys': ask_qtys,
+                'mid_price': float(mid_price),
+                'spread_pct': float(spread_pct),
+                'ofi_ratio': float(ofi),
+                'bid_pressure': float(bid_pressure),
+                'ask_pressure': float(ask_pressure),
+                'bid_walls': bid_walls,
+                'ask_walls': ask_walls,
             }
             
-            self.price_data[symbol]['last_price'] = mid_price
+            entry['last_price'] = float(mid_price)
             
-            if symbol in self.callbacks:
-                await self.callbacks[symbol]('orderbook', self.price_data[symbol]['orderbook'])
+            await self._dispatch(symbol, 'orderbook', orderbook)
                     
         except Exception as e:
-            logger.error(f"OB error: {e}")
-    
-    async def _handle_trade_single(self, data: Dict):
-        symbol = data.get('s', '').upper()
-        if symbol:
-            await self._handle_trade(symbol, {
-                'p': data.get('p'), 'q': data.get('q'),
-                'T': data.get('T'), 'm': data.get('m')
-            })
+            logger.error("OB error: %s", e)
     
-    async def _handle_orderbook_single(self, data: Dict):
-        symbol = data.get('s', '').upper()
-        if not symbol:
+    async def _dispatch(self, symbol: str, kind: str, payload: Dict):
+        """Await the symbol's callback inline so events arrive in order -
+        callbacks must stay cheap and hand slow work off themselves"""
+        callback = self.callbacks.get(symbol)
+        if callback is None:
             return
-            
-        bids = [[float(b[0]), float(b[1])] for b in data.get('b', [])]
-        asks = [[float(a[0]), float(a[1])] for a in data.get('a', [])]
-        
-        await self._handle_orderbook(symbol, {'bids': bids, 'asks': asks})
+        try:
+            await callback(kind, payload)
+        except Exception as e:
+            logger.error("Callback error (%s %s): %s", symbol, kind, e)
     
     def get_price_data(self, symbol: str) -> Dict:
         return self.price_data.get(symbol, {})
     
+    def get_orderbook_as_lists(self, symbol: str) -> Dict:
+        """Top-of-book levels as [[price, qty], ...] lists for legacy callers"""
+        ob = self.price_data.get(symbol, {}).get('orderbook')
+        if not ob:
+            return {'bids': [], 'asks': []}
+        return {
+            'bids': np.column_stack((ob['bid_prices'], ob['bid_qtys'])).tolist(),
+            'asks': np.column_stack((ob['ask_prices'], ob['ask_qtys'])).tolist(),
+        }
+    
+    def serialize_ob(self, symbol: str) -> bytes:
+        """Latest orderbook as JSON bytes, numpy columns included"""
+        ob = self.price_data.get(symbol, {}).get('orderbook')
+        return _dumps(ob) if ob else b'{}'
+    
     def get_recent_trades(self, symbol: str, limit: int = 30) -> list:
-        """FIX: Properly convert deque to list"""
-        data = self.price_data.get(symbol, {})
-        trades = data.get('trades', deque())
-        # FIX: Convert deque to list for slicing
-        trades_list = list(trades)
-        return trades_list[-limit:] if trades_list else []
+        """Newest `limit` trades, oldest first"""
+        trades = self.price_data.get(symbol, {}).get('trades')
+        if not trades:
+            return []
+        # Copy only the tail instead of the whole deque
+        start = len(trades) - limit if limit > 0 else 0
+        return list(islice(trades, max(0, start), None))
     
     def get_last_price(self, symbol: str) -> float:
         data = self.price_data.get(symbol, {})
         return data.get('last_price', 0)
     
     def register_callback(self, symbol: str, callback: Callable):
+        """Register `async callback(kind, payload)` for a symbol.
+
+        kind is 'trade' (payload: price/qty/time/m) or 'orderbook' (payload:
+        the orderbook dict, with levels as bid_prices/bid_qtys/ask_prices/
+        ask_qtys numpy arrays). Callbacks run on the receive loop, so
+        they must not block.
+        """
         self.callbacks[symbol] = callback
     
     def is_connected(self) -> bool:
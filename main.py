@@ -4,8 +4,11 @@ Integrated: Market Regime, Multi-Timeframe, Adaptive Optimizer
 """
 
 import os
+import atexit
 import asyncio
 import logging
+import logging.handlers
+import queue
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from threading import Thread
@@ -16,6 +19,7 @@ from config.settings import (
     PORT, 
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID, 
+    ECONOMIC_EVENTS,
     ASSETS_CONFIG, 
     TRADING_CONFIG, 
     STEALTH_CONFIG
@@ -47,6 +51,22 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+def _install_queue_logging() -> logging.handlers.QueueListener:
+    """Hand log records to a background thread so stream writes never block the event loop"""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+_log_listener = _install_queue_logging()
 logger = logging.getLogger(__name__)
 
 flask_app = Flask(__name__)
@@ -95,6 +115,8 @@ class AlphaBot:
         self.start_time = datetime.now(timezone.utc)
         self._sleep_notified = False
         
+        news_guard.load_schedule(ECONOMIC_EVENTS)
+        
         # Initialize CoinDCX
         if COINDCX_API_KEY and COINDCX_API_SECRET:
             init_coindcx_client(COINDCX_API_KEY, COINDCX_API_SECRET)
@@ -112,7 +134,7 @@ class AlphaBot:
             'stealth': StealthRequest(STEALTH_CONFIG),
             'data_agg': None,
             'asset_manager': MultiAssetManager(TRADING_CONFIG, ASSETS_CONFIG),
-            'trade_monitor': TradeMonitor(self.telegram),
+            'trade_monitor': TradeMonitor(self.telegram, self.time_filter),
             'market_context': MarketContext(),
             'performance': PerformanceTracker()
         }
@@ -210,12 +232,23 @@ class AlphaBot:
         
         try:
             ws_task = asyncio.create_task(ws_manager.start(ASSETS_CONFIG))
+            
             await asyncio.sleep(3)
             
             monitor_task = asyncio.create_task(
-                comps['trade_monitor'].start_monitoring(self._get_current_price)
+                comps['trade_monitor'].start_monitoring(
+                    self._get_current_price, self._get_current_prices
+                )
             )
             
+            # Streamed trades push price moves into the monitor
+            for asset, config in ASSETS_CONFIG.items():
+                if config.get('enable'):
+                    ws_manager.register_callback(
+                        config['symbol'],
+                        self._price_push_callback(comps['trade_monitor'], asset)
+                    )
+            
             session_active = True
             while session_active and self.running:
                 try:
@@ -255,6 +288,8 @@ class AlphaBot:
                 except asyncio.CancelledError:
                     pass
             
+            await comps['stealth'].aclose()
+            
             logger.info("Session ended")
     
     async def _process_cycle(self, comps: Dict):
@@ -290,11 +325,14 @@ class AlphaBot:
         if not merged_data:
             return
         
+        news_checks = news_guard.check_trading_allowed_batch(list(merged_data))
+        
         signals = []
         for asset, data in merged_data.items():
             # NEW: Update regime detector
             if data.spot_price > 0:
                 regime_detector.update_price(asset, data.spot_price)
+                comps['market_context'].ingest_tick(asset, data.spot_price)
             
             current_regime = regime_detector.detect_regime(asset)
             regime_ok, regime_config = regime_detector.should_trade(asset)
@@ -329,7 +367,7 @@ class AlphaBot:
             if not context['trade_allowed']:
                 continue
             
-            news_ok, news_status = await news_guard.check_trading_allowed(asset)
+            news_ok, news_status = news_checks[asset]
             if not news_ok:
                 continue
             
@@ -534,6 +572,22 @@ class AlphaBot:
             return ws_data['last_price']
         return 0
     
+    @staticmethod
+    def _price_push_callback(monitor: TradeMonitor, asset: str):
+        """WebSocket callback forwarding trade prices for one asset to the monitor"""
+        async def _on_ws_event(kind: str, payload: Dict):
+            if kind == 'trade':
+                monitor.on_price(asset, payload['price'])
+        return _on_ws_event
+    
+    async def _get_current_prices(self, assets: List[str]) -> Dict[str, float]:
+        """Last WebSocket prices for several assets in one call"""
+        prices = {}
+        for asset in assets:
+            ws_data = ws_manager.get_price_data(ASSETS_CONFIG[asset]['symbol'])
+            prices[asset] = ws_data.get('last_price', 0) if ws_data else 0
+        return prices
+    
     async def _fetch_ohlcv(self, asset: str, timeframe: str) -> List[Dict]:
         """Fetch OHLCV data for MTF analysis"""
         # TODO: Implement with your preferred data source